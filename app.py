@@ -3,11 +3,14 @@ from fastapi.responses import JSONResponse
 
 from food.controllers.contents import contents_router
 from food.controllers.food import food_router
+from food.controllers.formats import avro_schemas_router
 from food.exception import ModelNotFoundException
+from food.infra.db.engine import statement_cache_stats
 
 app = FastAPI()
 app.include_router(contents_router)
 app.include_router(food_router)
+app.include_router(avro_schemas_router)
 
 
 @app.exception_handler(ModelNotFoundException)
@@ -16,3 +19,8 @@ async def unicorn_not_found_exception_handler(request: Request, exc: ModelNotFou
         status_code=status.HTTP_404_NOT_FOUND,
         content={"error": exc.content},
     )
+
+
+@app.get('/statement-cache', tags=['Monitoring'])
+async def statement_cache() -> JSONResponse:
+    return JSONResponse(content=statement_cache_stats(), status_code=status.HTTP_200_OK)
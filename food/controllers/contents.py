@@ -1,10 +1,11 @@
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Header, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse, Response
 
+from food.controllers.formats import CONTENT_SCHEMA, list_response
 from food.controllers.models.contents import Content, ContentPatch
 from food.exception import ModelNotFoundException
 from food.infra.db.engine import engine
@@ -18,12 +19,13 @@ contents_router = APIRouter(
 
 
 @contents_router.get('')
-async def get(name: Optional[str] = None, calories_order: Optional[SortOrderEnum] = None) -> JSONResponse:
+async def get(name: Optional[str] = None, calories_order: Optional[SortOrderEnum] = None,
+              accept: Optional[str] = Header(default=None)) -> Response:
     with engine.connect() as conn:
         if name:
             return JSONResponse(content=jsonable_encoder(contents.get_by_name(conn, name)), status_code=status.HTTP_200_OK)
         if calories_order:
-            return JSONResponse(content=jsonable_encoder(contents.filter_by_calories(conn, calories_order)), status_code=status.HTTP_200_OK)
+            return list_response(accept, contents.filter_by_calories(conn, calories_order), CONTENT_SCHEMA)
 
 
 @contents_router.get('/{id}')
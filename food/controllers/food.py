@@ -1,10 +1,11 @@
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Header, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse, Response
 
+from food.controllers.formats import FOOD_SCHEMA, list_response
 from food.controllers.models.food import Food, PatchFood
 from food.infra.db.engine import engine
 from food.infra.db.enumerations import SortOrderEnum
@@ -23,12 +24,12 @@ async def get_by_id(id: UUID) -> JSONResponse:
 
 
 @food_router.get('')
-async def get(name: Optional[str] = None, calories: Optional[SortOrderEnum] = None, price: Optional[SortOrderEnum] = None) -> JSONResponse:
+async def get(name: Optional[str] = None, calories: Optional[SortOrderEnum] = None, price: Optional[SortOrderEnum] = None,
+              accept: Optional[str] = Header(default=None)) -> Response:
     with engine.connect() as conn:
         if name:
-            return JSONResponse(content=jsonable_encoder(food.get_by_name(conn, name)), status_code=status.HTTP_200_OK)
-        return JSONResponse(content=jsonable_encoder(food.apply_filter(conn, food.filter(calories, price))),
-                            status_code=status.HTTP_200_OK)
+            return list_response(accept, food.get_by_name(conn, name), FOOD_SCHEMA, nested='content')
+        return list_response(accept, food.apply_filter(conn, food.filter(calories, price)), FOOD_SCHEMA, nested='content')
 
 
 @food_router.post('')
@@ -0,0 +1,158 @@
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Any, Optional
+
+from fastapi import APIRouter, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from fastavro import parse_schema, schemaless_writer
+from fastavro.schema import fingerprint, to_parsing_canonical_form
+
+from food.exception import ModelNotFoundException
+
+JSON_MEDIA_TYPE = 'application/json'
+COLUMNAR_MEDIA_TYPE = 'application/vnd.food.columnar+json'
+AVRO_MEDIA_TYPE = 'application/avro'
+
+SUPPORTED_MEDIA_TYPES = (JSON_MEDIA_TYPE, COLUMNAR_MEDIA_TYPE, AVRO_MEDIA_TYPE)
+
+TIMESTAMP = {'type': 'long', 'logicalType': 'timestamp-micros'}
+NULLABLE_TIMESTAMP = ['null', TIMESTAMP]
+UUID_STRING = {'type': 'string', 'logicalType': 'uuid'}
+
+CONTENT_RECORD = {
+    'type': 'record',
+    'name': 'Content',
+    'namespace': 'food',
+    'fields': [
+        {'name': 'id', 'type': UUID_STRING},
+        {'name': 'name', 'type': 'string'},
+        {'name': 'calories', 'type': 'long'},
+        {'name': 'count', 'type': 'long'},
+        {'name': 'created_at', 'type': TIMESTAMP},
+        {'name': 'updated_at', 'type': NULLABLE_TIMESTAMP},
+    ],
+}
+
+FOOD_RECORD = {
+    'type': 'record',
+    'name': 'Food',
+    'namespace': 'food',
+    'fields': [
+        {'name': 'id', 'type': UUID_STRING},
+        {'name': 'name', 'type': 'string'},
+        {'name': 'size', 'type': 'string'},
+        {'name': 'type', 'type': 'string'},
+        {'name': 'price', 'type': 'long'},
+        {'name': 'calories', 'type': 'long'},
+        {'name': 'prepared_time', 'type': TIMESTAMP},
+        {'name': 'content', 'type': {'type': 'array', 'items': CONTENT_RECORD}},
+        {'name': 'category', 'type': 'string'},
+        {'name': 'time_to_prepare', 'type': 'string'},
+        {'name': 'created_at', 'type': TIMESTAMP},
+        {'name': 'updated_at', 'type': NULLABLE_TIMESTAMP},
+    ],
+}
+
+
+@dataclass(frozen=True)
+class AvroSchema:
+    schema: dict
+    parsed: dict
+    fingerprint: str
+
+
+def avro_schema(schema: dict) -> AvroSchema:
+    """ Parse an avro schema once and fingerprint its canonical form so clients can fetch it by fingerprint. """
+    return AvroSchema(schema=schema, parsed=parse_schema(schema),
+                      fingerprint=fingerprint(to_parsing_canonical_form(schema), 'CRC-64-AVRO'))
+
+
+CONTENT_SCHEMA = avro_schema({'type': 'array', 'items': CONTENT_RECORD})
+FOOD_SCHEMA = avro_schema({'type': 'array', 'items': FOOD_RECORD})
+AVRO_SCHEMAS = {avro.fingerprint: avro for avro in (CONTENT_SCHEMA, FOOD_SCHEMA)}
+
+avro_schemas_router = APIRouter(
+    prefix='/avro-schemas',
+    tags=['Formats']
+)
+
+
+@avro_schemas_router.get('/{schema_fingerprint}')
+async def get_avro_schema(schema_fingerprint: str) -> JSONResponse:
+    if avro := AVRO_SCHEMAS.get(schema_fingerprint):
+        return JSONResponse(content=avro.schema, status_code=status.HTTP_200_OK)
+    raise ModelNotFoundException('AvroSchema', 'fingerprint', schema_fingerprint)
+
+
+def quality(params: list[str]) -> float:
+    """ Return the q-value of a media range from its parameters, a missing q counts as 1 and a malformed one as 0. """
+    for param in params:
+        key, _, value = param.partition('=')
+        if key.strip() == 'q':
+            try:
+                return float(value)
+            except ValueError:
+                return 0.0
+    return 1.0
+
+
+def negotiate(accept: Optional[str]) -> str:
+    """ Pick the supported media type with the highest q-value from the Accept header, falling back to plain JSON. """
+    best_media_type, best_quality = JSON_MEDIA_TYPE, 0.0
+    for media_range in (accept or '').split(','):
+        media_type, *params = media_range.strip().lower().split(';')
+        media_type = media_type.strip()
+        if media_type in SUPPORTED_MEDIA_TYPES and (media_quality := quality(params)) > best_quality:
+            best_media_type, best_quality = media_type, media_quality
+    return best_media_type
+
+
+def to_columns(rows: list[dict]) -> dict[str, list]:
+    """ Turn a list of rows into a mapping of field name to the list of that field's values. """
+    return {key: [row[key] for row in rows] for key in rows[0]} if rows else {}
+
+
+def to_columnar(rows: list[dict], nested: Optional[str] = None) -> dict[str, Any]:
+    """ Build the columnar payload, nested rows are deduplicated by id into a shared table referenced by index. """
+    if not nested:
+        return {'columns': to_columns(rows)}
+
+    indexes: dict[Any, int] = {}
+    shared_rows = []
+    for row in rows:
+        for nested_row in row[nested]:
+            if nested_row['id'] not in indexes:
+                indexes[nested_row['id']] = len(shared_rows)
+                shared_rows.append(nested_row)
+
+    columns = to_columns([{**row, nested: [indexes[nested_row['id']] for nested_row in row[nested]]} for row in rows])
+    return {'columns': columns, nested: to_columns(shared_rows)}
+
+
+def to_avro_record(row: Any) -> dict[str, Any]:
+    """ Convert a repository dataclass into an avro record, uuids are written as their string form. """
+    record = {**vars(row), 'id': str(row.id)}
+    if isinstance(record.get('content'), list):
+        record['content'] = [to_avro_record(content) for content in record['content']]
+    return record
+
+
+def to_avro(rows: list[Any], avro: AvroSchema) -> bytes:
+    """ Encode the rows as a single schemaless avro array, the schema is published under its fingerprint. """
+    buffer = BytesIO()
+    schemaless_writer(buffer, avro.parsed, [to_avro_record(row) for row in rows])
+    return buffer.getvalue()
+
+
+def list_response(accept: Optional[str], rows: Optional[list[Any]], avro: AvroSchema, nested: Optional[str] = None) -> Response:
+    """ Render a list endpoint result in the media type negotiated from the Accept header. """
+    headers = {'Vary': 'Accept'}
+    media_type = negotiate(accept)
+    if media_type == COLUMNAR_MEDIA_TYPE:
+        return JSONResponse(content=to_columnar(jsonable_encoder(rows or []), nested), status_code=status.HTTP_200_OK,
+                            media_type=COLUMNAR_MEDIA_TYPE, headers=headers)
+    if media_type == AVRO_MEDIA_TYPE:
+        return Response(content=to_avro(rows or [], avro), status_code=status.HTTP_200_OK, media_type=AVRO_MEDIA_TYPE,
+                        headers={**headers, 'X-Avro-Schema-Fingerprint': avro.fingerprint})
+    return JSONResponse(content=jsonable_encoder(rows), status_code=status.HTTP_200_OK, headers=headers)
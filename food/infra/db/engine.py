@@ -1,6 +1,10 @@
+from collections import Counter
 from os import getenv
+from threading import Lock
+from typing import Any
 
-from sqlalchemy import MetaData, create_engine
+from sqlalchemy import MetaData, create_engine, event
+from sqlalchemy.engine import Connection, ExecutionContext
 
 
 def get_db_url() -> str:
@@ -15,3 +19,24 @@ def get_db_url() -> str:
 
 engine = create_engine(get_db_url())
 metadata = MetaData()
+statement_cache: Counter[str] = Counter()
+statement_cache_lock = Lock()
+
+
+@event.listens_for(engine, 'before_cursor_execute')
+def count_statement_cache(conn: Connection, cursor: Any, statement: str, parameters: Any,
+                          context: ExecutionContext, executemany: bool) -> None:
+    """ Count whether each executed statement reused its compiled form from the engine's statement cache. """
+    if context.cache_hit is engine.dialect.CACHE_HIT:
+        with statement_cache_lock:
+            statement_cache['hits'] += 1
+    elif context.cache_hit is engine.dialect.CACHE_MISS:
+        with statement_cache_lock:
+            statement_cache['misses'] += 1
+
+
+def statement_cache_stats() -> dict[str, float]:
+    """ Return the statement cache hits, misses and hit rate since the process started. """
+    with statement_cache_lock:
+        hits, misses = statement_cache['hits'], statement_cache['misses']
+    return {'hits': hits, 'misses': misses, 'hit_rate': hits / (hits + misses) if hits + misses else 0.0}
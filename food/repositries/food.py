@@ -1,9 +1,11 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import func, select
-from sqlalchemy.dialects.postgresql import array, insert
+from sqlalchemy import String, any_, bindparam, cast, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.engine import Connection
 from sqlalchemy.sql.selectable import Select
 
@@ -33,19 +35,45 @@ MEAL_ADDIONAL_CALORIES = 300
 MEDUIM_SIZE = 2
 LARGE_SIZE = 3
 
+# Lists are bound as a single array parameter compared with `= ANY(...)`, so the SQL text stays the same for any list length.
+UUID_ARRAY = ARRAY(PG_UUID(as_uuid=True))
+IDS = cast(bindparam('ids'), UUID_ARRAY)
+NAMES = cast(bindparam('names'), ARRAY(String))
+FOOD_VALUES = {
+    'name': bindparam('name'),
+    'size': bindparam('size'),
+    'type': bindparam('type'),
+    'category': bindparam('category'),
+    'price': bindparam('price'),
+    'content': cast(bindparam('content'), UUID_ARRAY),
+    'prepared_time': bindparam('prepared_time'),
+    'calories': bindparam('calories'),
+}
+INSERT_FOOD_WITH_ID = insert(food).values(id=bindparam('id'), **FOOD_VALUES)
+
+SELECT_CONTENTS_BY_IDS = contents.select().where(contents.c.id == any_(IDS))
+SELECT_CONTENTS_IDS_BY_NAMES = select([contents.c.name, contents.c.id]).where(contents.c.name == any_(NAMES))
+SUM_CONTENTS_CALORIES = select(func.sum(contents.c.calories)).where(contents.c.id == any_(IDS))
+SELECT_BY_ID = food.select().where(food.c.id == bindparam('id'))
+SELECT_BY_NAME = food.select().where(food.c.name == bindparam('name'))
+NEW = insert(food).values(**FOOD_VALUES).returning(food)
+UPSERT = INSERT_FOOD_WITH_ID.on_conflict_do_update(
+    index_elements=['id'],
+    set_={'content': INSERT_FOOD_WITH_ID.excluded.content,
+          'updated_at': bindparam('now')}).returning(food)
+DELETE = food.delete().where(food.c.id == bindparam('id'))
+
 
 def get_contents_by_id(conn: Connection, contents_list: list[UUID]) -> list[Content]:
     """ Get contents by id from contents table base on food contents list. """
-    return [Content(**content._asdict()) for content in conn.execute(contents.select().where(contents.c.id.in_(contents_list))).fetchall()]
+    return [Content(**content._asdict()) for content in conn.execute(SELECT_CONTENTS_BY_IDS, {'ids': contents_list}).fetchall()]
 
 
 def apply_filter(conn: Connection, query: Select) -> list[food]:
     """ Apply the sort order filter and return a list of the ordered food base on the price, calories. """
     food_result = [Food(time_to_prepare=get_time_to_prepare(food.prepared_time),
                         **{**food._asdict()}) for food in conn.execute(query).fetchall()]
-    for food_info in food_result:
-        food_info.content = get_contents_by_id(conn, food_info.content)
-    return food_result
+    return [replace(food_info, content=get_contents_by_id(conn, food_info.content)) for food_info in food_result]
 
 
 def filter(calories_order_type: SortOrderEnum, price_order_type: SortOrderEnum) -> Select:
@@ -75,7 +103,7 @@ def convert_contents_string_to_uuid(conn: Connection, food_contents: list[str])
     uuids_list = []
     contents_list = []
 
-    for c in conn.execute(select([contents.c.name, contents.c.id]).where(contents.c.name.in_(food_contents))).fetchall():
+    for c in conn.execute(SELECT_CONTENTS_IDS_BY_NAMES, {'names': food_contents}).fetchall():
         contents_list.append(c.name)
         uuids_list.append(c.id)
 
@@ -92,7 +120,7 @@ def get_time_to_prepare(prepared_time: datetime) -> str:
 def new(conn: Connection, category: str, name: str, size: str, type: str, price: float,
         content_ids: list[UUID], prepared_time: datetime) -> Food:
     """ Insert a new food item into the database and return the inserted food object. """
-    if contents_calories_summation := conn.execute(select(func.sum(contents.c.calories)).where(contents.c.id.in_(content_ids))).scalar():
+    if contents_calories_summation := conn.execute(SUM_CONTENTS_CALORIES, {'ids': content_ids}).scalar():
         match size:
             case 'MEDUIM':
                 calories = contents_calories_summation * MEDUIM_SIZE
@@ -103,16 +131,16 @@ def new(conn: Connection, category: str, name: str, size: str, type: str, price:
 
         calories = calories + MEAL_ADDIONAL_CALORIES if category == 'MEAL' else calories
 
-    food_info = conn.execute(insert(food).values(
-        name=name,
-        size=size,
-        type=type,
-        price=price,
-        content=array(content_ids),
-        prepared_time=prepared_time,
-        calories=calories,
-        category=category
-    ).returning(food)).fetchone()
+    food_info = conn.execute(NEW, {
+        'name': name,
+        'size': size,
+        'type': type,
+        'price': price,
+        'content': content_ids,
+        'prepared_time': prepared_time,
+        'calories': calories,
+        'category': category
+    }).fetchone()
 
     return {**food_info._asdict(), 'content': get_contents_by_id(conn, content_ids),
             'time_to_prepare': get_time_to_prepare(food_info.prepared_time)}
@@ -120,14 +148,14 @@ def new(conn: Connection, category: str, name: str, size: str, type: str, price:
 
 def get_by_name(conn: Connection, name: str) -> list[Food]:
     """ Get a list of food by the food name, and raise if food name not found"""
-    if food_info := conn.execute(food.select().where(food.c.name == name)).fetchall():
+    if food_info := conn.execute(SELECT_BY_NAME, {'name': name}).fetchall():
         return [Food(**{**food_info_row._asdict(), 'time_to_prepare': get_time_to_prepare(food_info_row.prepared_time),
                 'content': get_contents_by_id(conn, food_info_row.content)}) for food_info_row in food_info]
 
 
 def get_by_id(conn: Connection, id: UUID) -> Food:
     """ Get the food item by id and return the Food object. """
-    if food_info := conn.execute(food.select().where(food.c.id == id)).fetchone():
+    if food_info := conn.execute(SELECT_BY_ID, {'id': id}).fetchone():
         food_data = {**food_info._asdict(), 'content': get_contents_by_id(conn, food_info.content)}
         return Food(time_to_prepare=get_time_to_prepare(food_info.prepared_time), **food_data)
     raise ModelNotFoundException('Food', 'id', id)
@@ -135,27 +163,23 @@ def get_by_id(conn: Connection, id: UUID) -> Food:
 
 def persist(conn: Connection, food_info: Food, content_ids: list[UUID]) -> Food:
     """ Persist a food item in the database. Returns: The persisted Food object """
-    food_info = conn.execute(insert(food).values(
-        id=food_info.id,
-        name=food_info.name,
-        size=food_info.size,
-        type=food_info.type,
-        category=food_info.category,
-        price=food_info.price,
-        content=array(content_ids),
-        prepared_time=food_info.prepared_time,
-        calories=food_info.calories
-    ).on_conflict_do_update(
-        index_elements=['id'],
-        set_={
-            'content': array(content_ids),
-            'updated_at': datetime.now()}
-    ).returning(food)).fetchone()
+    food_info = conn.execute(UPSERT, {
+        'id': food_info.id,
+        'name': food_info.name,
+        'size': food_info.size,
+        'type': food_info.type,
+        'category': food_info.category,
+        'price': food_info.price,
+        'content': content_ids,
+        'prepared_time': food_info.prepared_time,
+        'calories': food_info.calories,
+        'now': datetime.now()
+    }).fetchone()
     return {**food_info._asdict(), 'content': get_contents_by_id(conn, content_ids),
             'time_to_prepare': get_time_to_prepare(food_info.prepared_time)}
 
 
 def delete(conn: Connection, id: UUID) -> None:
     """ Delete Food item from the database. Raises: If the Food id not exist """
-    if not conn.execute(food.delete().where(food.c.id == id)).rowcount:
+    if not conn.execute(DELETE, {'id': id}).rowcount:
         raise ModelNotFoundException('Food', 'id', id)